@@ -32,7 +32,7 @@ def random_number(random, n: int) -> str:
 		return s
 
 
-def get_random_chars(allow_newlines: bool, allow_dollar: bool, allow_clamps: bool) -> List[str]:
+def get_random_chars(allow_newlines: bool, allow_dollar: bool, allow_clamps: bool) -> Tuple[str, ...]:
 	random_chars = " "  # space
 	random_chars += "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
 	random_chars += "éáèêäöüÄÖÜß?!.-_:;#§%&=^|{}[]()@+-*/~'\"\t\\"
@@ -48,14 +48,16 @@ def get_random_chars(allow_newlines: bool, allow_dollar: bool, allow_clamps: boo
 	if allow_dollar:
 		random_chars.extend(["$1"])
 
-	return random_chars
+	# return an immutable tuple: the pools are kept around for the lifetime
+	# of a TestContext and random.choice() draws from them in tight loops.
+	return tuple(random_chars)
 
 
 class TestContext:
 	settings: Settings
 	workarounds: Workarounds
-	cloze_random_chars: List[str]
-	long_text_random_chars: List[str]
+	cloze_random_chars: Tuple[str, ...]
+	long_text_random_chars: Tuple[str, ...]
 	coverage: Coverage
 	language: str
 	ilias_version: Tuple
@@ -82,23 +84,29 @@ class TestContext:
 		self.language = language
 		self.ilias_version = ilias_version
 
-	def _random_text(self, n: int, random_chars: List[str], allow_numbers: bool=True) -> str:
+	def _random_text(self, n: int, random_chars: Tuple[str, ...], allow_numbers: bool=True) -> str:
 		if allow_numbers and self.random.random() < self.settings.numbers_in_text_fields_p:
 			return random_number(self.random, n)
 		else:
 			components = list()
+			append = components.append
+			choices = self.random.choices
 
 			n_chars = 0
 			while n_chars < n:
-				p = self.random.choice(random_chars)
-
-				if n_chars == 0 and not allow_numbers:
-					if p.isdigit() or p == '.':
-						continue
-
-				if n_chars + len(p) <= n:
-					components.append(p)
-					n_chars += len(p)
+				# draw the whole remaining budget in one batched C-level call.
+				# picks that don't fit (multi-char entities near the end of
+				# the budget) are skipped and redrawn by the outer loop.
+				for p in choices(random_chars, k=n - n_chars):
+					if n_chars == 0 and not allow_numbers:
+						if p.isdigit() or p == '.':
+							continue
+
+					if n_chars + len(p) <= n:
+						append(p)
+						n_chars += len(p)
+						if n_chars >= n:
+							break
 
 			return "".join(components)
 
@@ -6,6 +6,8 @@
 #
 
 from typing import Dict
+import re
+import string
 import time
 import traceback
 import html
@@ -14,6 +16,7 @@ from enum import Enum
 from decimal import *
 from collections import defaultdict, namedtuple
 
+import numpy
 import selenium
 from selenium.common.exceptions import NoSuchElementException, ElementNotVisibleException
 from selenium.webdriver.support.select import Select
@@ -67,30 +70,43 @@ def _modify_answer(text: str, context: 'TestContext', max_len:int = None):
 		# keep exactly as specified.
 		return text
 	elif mode == "randperm":
-		text = ''.join(context.random.sample(text, len(text)))
-		return text
+		# shuffle a char list in place; random.sample would allocate an
+		# extra selection-tracking structure for the same permutation.
+		chars = list(text)
+		context.random.shuffle(chars)
+		return "".join(chars)
 	elif mode == "randfull":
 		return context.produce_text(max_len, context.cloze_random_chars)
 	else:
-		# modify case or content.
-		chars = []
-		for i in range(len(text)):
-			r = context.random.random()
-			if mode == "randchar" and r < 0.2:
-				chars.append(context.random.choice(context.cloze_random_chars))
-			elif mode == "randcase" and r < 0.2:
-				chars.append(text[i].swapcase())
-			else:
-				chars.append(text[i])
+		# modify case or content. draw all per-character randoms in one
+		# vectorized call, so the Python-level loop only visits the ~20% of
+		# positions that actually change. the seed is derived from
+		# context.random to keep RegressionContext runs deterministic.
+		chars = list(text)
+		if chars:
+			rng = numpy.random.default_rng(context.random.randrange(2 ** 32))
+			indices = numpy.nonzero(rng.random(len(chars)) < 0.2)[0]
+			if mode == "randchar":
+				for i in indices:
+					chars[i] = context.random.choice(context.cloze_random_chars)
+			else:  # randcase
+				for i in indices:
+					chars[i] = chars[i].swapcase()
 		text = "".join(chars)
 		return text
 
 
+# all scores we hand out during readjustment are multiples of 1/4. build
+# the possible Decimal values once instead of allocating two Decimals and
+# performing a division for every single draw.
+_QUARTER_POINTS = tuple(Decimal(i) / Decimal(4) for i in range(3 * 4 + 1))
+
+
 def _readjust_score(random, score:Decimal):
 	if random.randint(1, 10) == 5:
-		return Decimal(0)
+		return _QUARTER_POINTS[0]
 	else:
-		return Decimal(random.randint(1, 3 * 4)) / Decimal(4)
+		return _QUARTER_POINTS[random.randint(1, 3 * 4)]
 
 def _count_answers(scoring, actual_answers, answer_counts):
 	if scoring.cloze_type != ClozeType.numeric:
@@ -138,7 +154,7 @@ def _readjust(context, scoring, gap, actual_answers, answer_counts):
 					unscored_answers.remove(new_answer)
 					assert new_answer not in new_options
 					# note: ILIAS 5.4 does not support negative scores in readjustment.
-					new_options[new_answer] = Decimal(random.randint(1, 8)) / Decimal(4)
+					new_options[new_answer] = _QUARTER_POINTS[random.randint(1, 8)]
 					just_added.add(new_answer)
 			else:
 				pass  # cannot add new answers for "select" or "numeric" gaps
@@ -158,7 +174,7 @@ def _readjust(context, scoring, gap, actual_answers, answer_counts):
 						new_answer = new_answer.replace('\t', '')
 
 					if len(new_answer) > 0 and new_answer not in new_options:
-						new_options[new_answer] = Decimal(random.randint(1, 8)) / Decimal(4)
+						new_options[new_answer] = _QUARTER_POINTS[random.randint(1, 8)]
 						just_added.add(new_answer)
 						break
 
@@ -184,6 +200,18 @@ def _readjust(context, scoring, gap, actual_answers, answer_counts):
 		return scoring._replace(options=readjusted_options)
 
 
+_ASCII_LOWER_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def _fold_ascii(s: str) -> str:
+	# equivalent to casefold() for pure-ascii strings, but without the
+	# unicode database walk. non-ascii input still casefolds properly, so
+	# e.g. "ß" becomes "ss" and matches ascii-only options.
+	if s.isascii():
+		return s.translate(_ASCII_LOWER_TABLE)
+	return s.casefold()
+
+
 class ClozeType(Enum):
 	text = 0
 	select = 1
@@ -202,12 +230,14 @@ class ClozeQuestionGap:
 
 	def __init__(self, index: int):
 		self.index = index
+		self._export_name = dict()
 
 	def get_maximum_score(self) -> Decimal:
 		raise NotImplementedError()
 
 	def get_export_name(self, language: str) -> str:
-		return ClozeQuestionGap._export_names[language] + " " + str(self.index + 1)
+		return self._export_name.setdefault(
+			language, ClozeQuestionGap._export_names[language] + " " + str(self.index + 1))
 
 	def is_valid_answer(self, value: str) -> bool:
 		raise NotImplementedError()
@@ -219,8 +249,32 @@ class ClozeQuestionTextGap(ClozeQuestionGap):
 		self.comparator = scoring.comparator
 		gap_scoring = scoring.gaps[index]
 		self.options = gap_scoring.options
+		# random.choice only needs indexing; keep a tuple of the items so
+		# get_random_choice does not rebuild a list per draw.
+		self._options_items = tuple(self.options.items())
 		self.size = gap_scoring.size  # maximum size
 
+		if self.comparator == ClozeComparator.ignore_case:
+			# options are fixed after construction, so fold them once here
+			# instead of on every get_score() call. options that collide after
+			# folding keep the best score, as before. with ascii-only options
+			# the cheaper translate-based fold gives identical keys.
+			if all(option.isascii() for option in self.options):
+				fold = _fold_ascii
+			else:
+				fold = str.casefold
+
+			folded_options = dict()
+			for option, score in self.options.items():
+				key = fold(option)
+				folded_options[key] = max(folded_options.get(key, Decimal(0)), score)
+			self._folded_options = folded_options
+			self._score_fn = lambda text, _get=folded_options.get, _fold=fold, _zero=Decimal(0): _get(
+				_fold(text), _zero)
+		else:
+			self._score_fn = lambda text, _get=self.options.get, _zero=Decimal(0): _get(
+				text, _zero)
+
 	def get_maximum_score(self) -> Decimal:
 		return max(self.options.values())
 
@@ -249,7 +303,7 @@ class ClozeQuestionTextGap(ClozeQuestionGap):
 	def get_random_choice(self, context: 'TestContext'):
 		if context.random.random() < float(context.settings.cloze_text_enter_scored_p) and not context.prefer_text():
 			# pick scored answer.
-			text, _ = context.random.choice(list(self.options.items()))
+			text, _ = context.random.choice(self._options_items)
 			return self._modify_answer(text, context)
 		else:
 			# make up something random and probably wrong.
@@ -267,16 +321,9 @@ class ClozeQuestionTextGap(ClozeQuestionGap):
 			return text, self.get_score(text, context)
 
 	def get_score(self, text: str, context: 'TestContext'):
-		if self.comparator == ClozeComparator.case_sensitive:
-			return self.options.get(text, Decimal(0))
-
-		assert self.comparator == ClozeComparator.ignore_case
-		best_score = Decimal(0)
-		for option, score in self.options.items():
-			if option.casefold() == text.casefold():
-				best_score = max(best_score, score)
-
-		return best_score
+		if not text:
+			return Decimal(0)
+		return self._score_fn(text)
 
 	def get_scored_options(self):
 		return self.options
@@ -295,6 +342,7 @@ class ClozeQuestionSelectGap(ClozeQuestionGap):
 	def __init__(self, scoring: ClozeScoring, index: int):
 		ClozeQuestionGap.__init__(self, index)
 		self.options = scoring.gaps[index].options
+		self._options_items = tuple(self.options.items())
 
 	def get_maximum_score(self) -> Decimal:
 		return max(self.options.values())
@@ -309,7 +357,7 @@ class ClozeQuestionSelectGap(ClozeQuestionGap):
 		coverage.case_occurred(question, self.index, channel, value)
 
 	def get_random_choice(self, context):
-		return context.random.choice(list(self.options.items()))
+		return context.random.choice(self._options_items)
 
 	def get_score(self, text: str, context: 'TestContext') -> Decimal:
 		return self.options.get(text, Decimal(0))
@@ -324,6 +372,12 @@ class ClozeQuestionSelectGap(ClozeQuestionGap):
 		return ClozeType.select
 
 
+# matches everything float() accepts from random answer texts. checking this
+# up front is much cheaper than unwinding a ValueError, and invalid answers
+# are common here (see settings.invalid_answer_p).
+_NUMERIC_RE = re.compile(r'^\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*$')
+
+
 def num_fract_digits(x):
 	s = str(x)
 	if '.' not in s:
@@ -341,6 +395,12 @@ class ClozeQuestionNumericGap(ClozeQuestionGap):
 		self.numeric_upper = gap_scoring.upper
 		self.score = gap_scoring.score
 
+		# cache the float bounds; float(Decimal) reparses the decimal
+		# representation on every call otherwise.
+		self._lower_f = float(self.numeric_lower)
+		self._upper_f = float(self.numeric_upper)
+		self._range_f = self._upper_f - self._lower_f
+
 	def _num_digits(self, context: 'TestContext') -> int:
 		if context.ilias_version >= (5, 4, 2):
 			# starting with ILIAS 5.4.2, ILIAS switched to 14 digits accuracy
@@ -424,16 +484,15 @@ class ClozeQuestionNumericGap(ClozeQuestionGap):
 			coverage.case_occurred(question, self.index, channel, occured)
 
 	def _get_random_inside(self, context: 'TestContext') -> float:
-		return context.random.uniform(float(self.numeric_lower), float(self.numeric_upper))
+		return context.random.uniform(self._lower_f, self._upper_f)
 
 	def _get_random_outside(self, context: 'TestContext') -> float:
 		r = 14  # generate fake numbers up to this scale
-		d = float(self.numeric_upper - self.numeric_lower)
-		off = context.random.uniform(10 ** -r, (10 ** r) * d)
+		off = context.random.uniform(10 ** -r, (10 ** r) * self._range_f)
 
 		return context.random.choice((
-			float(self.numeric_lower) - off,
-			float(self.numeric_upper) + off
+			self._lower_f - off,
+			self._upper_f + off
 		))
 
 	def get_random_choice(self, context: 'TestContext'):
@@ -445,8 +504,8 @@ class ClozeQuestionNumericGap(ClozeQuestionGap):
 
 		if s is None:
 			g = context.random.choice((
-				lambda _: float(self.numeric_lower),
-				lambda _: float(self.numeric_upper),
+				lambda _: self._lower_f,
+				lambda _: self._upper_f,
 				self._get_random_inside,
 				self._get_random_outside
 			))
@@ -458,15 +517,15 @@ class ClozeQuestionNumericGap(ClozeQuestionGap):
 		return s, self.get_score(s, context)
 
 	def get_score(self, text: str, context: 'TestContext') -> Decimal:
-		try:
-			n = float(text)
-			n = float(self._format_number(n, context))  # limit to number of representable digits
+		if not text or not _NUMERIC_RE.match(text):
+			return Decimal(0)
 
-			if float(self.numeric_lower) <= n <= float(self.numeric_upper):
-				return self.score
-			else:
-				return Decimal(0)
-		except ValueError:
+		n = float(text)
+		n = float(self._format_number(n, context))  # limit to number of representable digits
+
+		if self._lower_f <= n <= self._upper_f:
+			return self.score
+		else:
 			return Decimal(0)
 
 	def get_scored_options(self):
@@ -486,9 +545,33 @@ class ClozeQuestionNumericGap(ClozeQuestionGap):
 		return ClozeType.numeric
 
 
-def parse_gap_size(driver, gap_index):
-	element = driver.find_element_by_name("gap_%d_gapsize" % gap_index)
-	text = element.get_attribute("value").strip()
+def _scrape_cloze_ui_fields(driver: selenium.webdriver.Remote) -> Dict[str, str]:
+	# gather all gap-related form fields in a single WebDriver round trip.
+	# each find_element call is one HTTP request to the browser, and a cloze
+	# question with many gaps and options easily needs dozens of them.
+	return driver.execute_script('''
+		var fields = {};
+		var nodes = document.querySelectorAll("input, select, textarea");
+		for (var i = 0; i < nodes.length; i++) {
+			var node = nodes[i];
+			var key = node.name || node.id;
+			if (!/^(clozetype_|gap_|fixedTextLength$|identical_scoring$|textgap_rating$)/.test(key)) {
+				continue;
+			}
+			if (node.type == "checkbox") {
+				fields[key] = node.checked;
+			} else if (!(key in fields)) {
+				// like find_element_by_name, the first matching field wins;
+				// this also keeps checkbox states over same-named hidden inputs.
+				fields[key] = node.value;
+			}
+		}
+		return fields;
+		''')
+
+
+def parse_gap_size(fields: Dict[str, str], gap_index: int):
+	text = fields["gap_%d_gapsize" % gap_index].strip()
 	assert isinstance(text, str)
 	if text == '':
 		return None
@@ -496,32 +579,21 @@ def parse_gap_size(driver, gap_index):
 		return int(text)
 
 
-def parse_numeric_gap_scoring(driver: selenium.webdriver.Remote, gap_index: int) -> Dict:
-	value = Decimal(driver.find_element_by_name("gap_%d_numeric" % gap_index).get_attribute("value"))
-	lower = Decimal(driver.find_element_by_name("gap_%d_numeric_lower" % gap_index).get_attribute("value"))
-	upper = Decimal(driver.find_element_by_name("gap_%d_numeric_upper" % gap_index).get_attribute("value"))
-	score = Decimal(driver.find_element_by_name("gap_%d_numeric_points" % gap_index).get_attribute("value"))
-	return dict(value=value, lower=lower, upper=upper, score=score)
-
-
-def parse_gap_options(driver: selenium.webdriver.Remote, gap_index: int) -> Dict[str, Decimal]:
+def parse_gap_options(fields: Dict[str, str], gap_index: int) -> Dict[str, Decimal]:
 	options = dict()
 	seen = set()
 
 	while True:
-		try:
-			answer = driver.find_element_by_id("gap_%d[answer][%d]" % (gap_index, len(options)))
-		except NoSuchElementException:
+		answer_key = fields.get("gap_%d[answer][%d]" % (gap_index, len(options)))
+		if answer_key is None:
 			break
-		points = driver.find_element_by_id("gap_%d[points][%d]" % (gap_index, len(options)))
-
-		answer_key = answer.get_attribute("value")
+		points = fields["gap_%d[points][%d]" % (gap_index, len(options))]
 
 		if answer_key.strip() in seen:
 			raise InteractionException("the gap has multiple identical options named '%s'. unsupported." % answer_key)
 		seen.add(answer_key.strip())
 
-		options[answer_key] = Decimal(points.get_attribute("value"))
+		options[answer_key] = Decimal(points)
 
 	return options
 
@@ -576,10 +648,14 @@ class TextGapReadjuster(GapReadjuster):
 
 		normalized_options = dict((self._normalize_answer(k), v) for k, v in self.gap.options.items())
 
+		# fetch all points inputs of this gap in one round trip and reuse the
+		# element references instead of one find_element_by_id per option.
+		points_elements = self.driver.find_elements_by_css_selector(
+			"input[id^='gap_%d[points]']" % self.gap_index)
+
 		# set all scores (not yet set, i.e. not in keep_score).
-		for option_index, option_answer in enumerate(self._option_answers()):
+		for option_answer, points in zip(self._option_answers(), points_elements):
 			#if option_answer not in keep_score:
-			points = self.driver.find_element_by_id("gap_%d[points][%d]" % (self.gap_index, option_index))
 			points.clear()
 			try:
 				points.send_keys(str(normalized_options[self._normalize_answer(option_answer)]))
@@ -595,15 +671,14 @@ class TextGapReadjuster53(TextGapReadjuster):
 	def _get_option_answer_element(self, option_index):
 		return self.driver.find_element_by_id("gap_%d[answer][%d]" % (self.gap_index, option_index))
 
+	def _option_answer_elements(self):
+		# one WebDriver round trip for all answer inputs of this gap instead
+		# of probing ids one by one until NoSuchElementException.
+		return self.driver.find_elements_by_css_selector(
+			"input[id^='gap_%d[answer]']" % self.gap_index)
+
 	def _option_answers(self):
-		option_index = 0
-		while True:
-			try:
-				element = self._get_option_answer_element(option_index)
-				yield element.get_attribute("value").strip()
-			except NoSuchElementException:
-				break
-			option_index += 1
+		return [element.get_attribute("value").strip() for element in self._option_answer_elements()]
 
 	def _add_answer(self, option_index, option_key):
 		self.driver.find_element_by_name("add_gap_%d_%d" % (self.gap_index, option_index - 1)).click()
@@ -625,19 +700,19 @@ class TextGapReadjuster53(TextGapReadjuster):
 			option_index += 1
 
 	def _remove(self):
-		keys = list(self._option_answers())
+		keys = self._option_answers()
 		new_keys = set(self.gap.options.keys())
 
-		option_index = 0
 		for option_key in keys:
 			if len(option_key.strip()) == 0:
 				raise InteractionException("illegal empty option name")
 
-			if option_key not in new_keys:
+		# remove from the highest index down, so the options still to be
+		# removed do not get renumbered while we are clicking.
+		for option_index in reversed(range(len(keys))):
+			if keys[option_index] not in new_keys:
 				self.driver.find_element_by_name(
 					"remove_gap_%d_%d" % (self.gap_index, option_index)).click()
-			else:
-				option_index += 1
 
 	def extend_scores(self):
 		self._add()
@@ -803,7 +878,9 @@ class TextGapReadjuster54(TextGapReadjuster):
 class ClozeQuestion(Question):
 	@staticmethod
 	def _get_ui(driver: selenium.webdriver.Remote) -> ClozeScoring:
-		fixed_text_length = driver.find_element_by_name("fixedTextLength").get_attribute("value").strip()
+		fields = _scrape_cloze_ui_fields(driver)
+
+		fixed_text_length = fields["fixedTextLength"].strip()
 		if fixed_text_length == '':
 			fixed_text_length = None
 		else:
@@ -814,22 +891,21 @@ class ClozeQuestion(Question):
 		while True:
 			gap_index = len(gaps)
 
-			try:
-				cloze_type_element = driver.find_element_by_name("clozetype_%d" % gap_index)
-			except NoSuchElementException:
+			cloze_type_value = fields.get("clozetype_%d" % gap_index)
+			if cloze_type_value is None:
 				break
 
-			cloze_type = ClozeType(int(cloze_type_element.get_attribute("value")))
+			cloze_type = ClozeType(int(cloze_type_value))
 
 			if cloze_type != ClozeType.select:
-				gap_size = parse_gap_size(driver, gap_index)
+				gap_size = parse_gap_size(fields, gap_index)
 				if gap_size is None:
 					gap_size = fixed_text_length
 			else:
 				gap_size = None
 
 			if cloze_type in (ClozeType.text, ClozeType.select):
-				options = parse_gap_options(driver, gap_index)
+				options = parse_gap_options(fields, gap_index)
 
 				if not options:
 					raise InteractionException("did not find gap options (%d)" % gap_index)
@@ -838,19 +914,22 @@ class ClozeQuestion(Question):
 					cloze_type=cloze_type, size=gap_size, options=options)
 
 			elif cloze_type == ClozeType.numeric:
+				prefix = "gap_%d_numeric" % gap_index
 				scoring = NumericGapScoring(
 					cloze_type=ClozeType.numeric,
-					**parse_numeric_gap_scoring(driver, gap_index))
+					value=Decimal(fields[prefix]),
+					lower=Decimal(fields[prefix + "_lower"]),
+					upper=Decimal(fields[prefix + "_upper"]),
+					score=Decimal(fields[prefix + "_points"]))
 
 			else:
 				raise NotImplementedException("unsupported cloze type " + str(cloze_type))
 
 			gaps.append(scoring)
 
-		identical_scoring = driver.find_element_by_name("identical_scoring").is_selected()
+		identical_scoring = fields["identical_scoring"]
 
-		comparator = ClozeComparator(driver.find_element_by_css_selector(
-			"#textgap_rating option[selected]").get_attribute("value"))
+		comparator = ClozeComparator(fields["textgap_rating"])
 
 		return ClozeScoring(
 			identical_scoring=identical_scoring,
@@ -935,6 +1014,22 @@ class ClozeQuestion(Question):
 
 	def _create_gaps(self):
 		self.gaps = _create_gaps(self.scoring)
+		self._gap_list = list(self.gaps.values())
+
+		# map export names in all languages to gap indices once, so
+		# compute_score() does not rebuild this dict on every call.
+		self._name_to_index = dict()
+		for gap in self.gaps.values():
+			for language in ClozeQuestionGap._export_names:
+				self._name_to_index[gap.get_export_name(language)] = gap.index
+
+		# pick the normalization function once; the comparator only changes
+		# when the gaps are recreated (e.g. after readjustment).
+		if self.scoring.comparator == ClozeComparator.ignore_case:
+			self._normalize = str.casefold
+		else:
+			assert self.scoring.comparator == ClozeComparator.case_sensitive
+			self._normalize = str
 
 	def __init__(self, driver, title, settings):
 		super().__init__(title)
@@ -964,31 +1059,54 @@ class ClozeQuestion(Question):
 		return self.gap[index]
 
 	def _get_normalized(self, s: str) -> str:
-		if self.scoring.comparator == ClozeComparator.case_sensitive:
-			return s
-		else:
-			assert self.scoring.comparator == ClozeComparator.ignore_case
-			return s.casefold()
+		return self._normalize(s)
 
 	def _is_empty_answer(self, answer, context) -> bool:
 		answer = context.strip_whitespace(answer)
 		return len(answer) == 0
 
 	def get_random_answer(self, context):
+		gap_list = self._gap_list
+
+		if len(gap_list) == 1:
+			# fast path: a single gap has no "previous" answers to share, so
+			# skip the shuffling and per-type bookkeeping entirely.
+			gap = gap_list[0]
+			while True:
+				choice, score = gap.get_random_choice(context)
+
+				if context.workarounds.disallow_empty_answers and self._is_empty_answer(choice, context):
+					continue  # retry
+
+				answers = {gap.index: choice}
+				valid = {gap.index: gap.is_valid_answer(choice)}
+				return answers, valid, score
+
+		previous_answers_p = float(context.settings.cloze_previous_answer_p)
+
+		# there are exactly three gap types; preallocate their sets once and
+		# clear them per attempt instead of building a defaultdict each time.
+		previous_answers = {
+			ClozeType.text: set(),
+			ClozeType.select: set(),
+			ClozeType.numeric: set()}
+
 		while True:
 			answers = dict()
 			valid = dict()
+			scores = dict()
 
-			previous_answers = defaultdict(set)
-			previous_answers_p = float(context.settings.cloze_previous_answer_p)
+			for seen in previous_answers.values():
+				seen.clear()
 			all_empty = True
 
-			shuffled_gaps = list(self.gaps.values())
+			shuffled_gaps = gap_list[:]
 			context.random.shuffle(shuffled_gaps)  # randomize our "previous" value logic
 
 			for gap in shuffled_gaps:
 				previous = previous_answers[gap.get_type()]
 				choice = None
+				score = None
 
 				if len(previous) > 0 and context.random.random() < previous_answers_p:
 					# use some previous answer to explicitly test identical_scoring
@@ -998,20 +1116,25 @@ class ClozeQuestion(Question):
 					# trying to set a select gap to some illegal value causes problems.
 					if not gap.is_valid_answer(choice):
 						choice = None
+					else:
+						# only reused answers need scoring here; fresh choices
+						# below come back with their score already computed.
+						score = gap.get_score(choice, context)
 
 				if choice is None:
-					choice, _ = gap.get_random_choice(context)
+					choice, score = gap.get_random_choice(context)
 
 				previous.add(choice)
 
 				answers[gap.index] = choice
+				scores[gap.index] = score
 				valid[gap.index] = gap.is_valid_answer(choice)
 				all_empty = all_empty and self._is_empty_answer(choice, context)
 
 			if all_empty and context.workarounds.disallow_empty_answers:
 				pass  # retry
 			else:
-				return answers, valid, self.compute_score_by_indices(answers, context)
+				return answers, valid, self._aggregate_scores(answers, scores, context)
 
 	def readjust_scores(self, driver, actual_answers: Dict[str, str], context: 'TestContext', report):
 		def random_flip_scoring(f):
@@ -1096,9 +1219,7 @@ class ClozeQuestion(Question):
 		# normalize answers: "a " will score the same as "a".
 		answers = dict((k, v.strip()) for k, v in answers.items())
 
-		name_to_index = dict()
-		for gap in self.gaps.values():
-			name_to_index[gap.get_export_name(context.language)] = gap.index
+		name_to_index = self._name_to_index
 
 		indexed_answers = dict()
 		for name, value in answers.items():
@@ -1107,27 +1228,51 @@ class ClozeQuestion(Question):
 		return self.compute_score_by_indices(indexed_answers, context)
 
 	def compute_score_by_indices(self, answers: Dict[int, str], context: 'TestContext') -> Decimal:
-		score = Decimal(0)
+		gaps = self.gaps
 
 		if self.scoring.identical_scoring:
-			for index, text in answers.items():
-				score += self.gaps[index].get_score(text, context)
+			# let sum() drive the accumulation at C level; the per-gap lookup
+			# itself is already a single dict access after the folded-options
+			# precomputation.
+			return sum(
+				(gaps[index].get_score(text, context) for index, text in answers.items() if text),
+				Decimal(0))
+
+		scores = dict(
+			(index, gaps[index].get_score(text, context) if text else Decimal(0))
+			for index, text in answers.items())
+		return self._aggregate_scores(answers, scores, context)
+
+	def _aggregate_scores(self, answers: Dict[int, str], scores: Dict[int, Decimal], context: 'TestContext') -> Decimal:
+		# sum up per-gap scores that have already been computed, applying the
+		# identical_scoring deduplication logic.
+		if self.scoring.identical_scoring:
+			return sum(scores.values(), Decimal(0))
+
+		# decide how to normalize answers once, not once per answer.
+		if self.scoring.comparator == ClozeComparator.ignore_case and \
+			not context.workarounds.identical_scoring_ignores_comparator:
+			normalize = str.casefold
 		else:
-			# make sure answers are sorted as self.identical_scoring won't be
-			# computed correctly otherwise.
-			sorted_answers = sorted(list(answers.items()), key=lambda x: int(x[0]))
-
-			given_answers = set()
-			for index, text in sorted_answers:
-				comparable_text = text
-
-				if not context.workarounds.identical_scoring_ignores_comparator:
-					if self.scoring.comparator == ClozeComparator.ignore_case:
-						comparable_text = text.casefold()
-				if comparable_text in given_answers:
-					continue
-				given_answers.add(comparable_text)
-
-				score += self.gaps[index].get_score(text, context)
+			normalize = str
+
+		# make sure answers are processed sorted by index, as
+		# self.identical_scoring won't be computed correctly otherwise.
+		score = Decimal(0)
+		given_answers = set()
+		add = given_answers.add
+		for index in sorted(answers):
+			text = answers[index]
+			if not text:
+				# empty answers always score zero and cannot collide
+				# with any normalized non-empty answer.
+				continue
+
+			comparable_text = normalize(text)
+			if comparable_text in given_answers:
+				continue
+			add(comparable_text)
+
+			score += scores[index]
 
 		return score